@@ -11,13 +11,26 @@ Usage:
 Output: JSON report to stdout, status messages to stderr.
 """
 
+import functools
 import json
+import os
 import sys
 import re
 import plistlib
+import shutil
+import subprocess
 import xml.etree.ElementTree as ET
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is the fallback
+    orjson = None
+
+_loads = orjson.loads if orjson else json.loads
+
 VAGUE_PERMISSION_PHRASES = (
     "needed for app to function",
     "needed for the app to function",
@@ -31,7 +44,104 @@ VAGUE_PERMISSION_PHRASES = (
     "for app features",
 )
 
-SKIP_PATH_SEGMENTS = ("Pods", "build", "DerivedData", "node_modules", ".dart_tool")
+# Hardcoded secret patterns in reporting priority order. They are combined
+# into SECRET_RE so each file is searched once; the named group that matched
+# tells whether a higher-priority pattern still has to be checked.
+SECRET_PATTERNS = {
+    "generic": re.compile(rb'(?i:(?:api[_-]?key|secret[_-]?key|password)\s*[:=]\s*"[^"]{8,}")'),
+    "stripe": re.compile(rb'sk[-_](?:live|test)_[a-zA-Z0-9]{20,}'),
+    "google": re.compile(rb'AIza[0-9A-Za-z\-_]{35}'),
+}
+SECRET_RE = re.compile(
+    b"|".join(b"(?P<%s>%s)" % (name.encode(), pattern.pattern) for name, pattern in SECRET_PATTERNS.items())
+)
+SECRET_LABELS = {
+    "generic": "Possible hardcoded API key/secret",
+    "stripe": "Possible Stripe secret key",
+    "google": "Possible Google API key",
+}
+SECRET_SCAN_CHUNK = 64 * 1024
+SECRET_SCAN_MAX_BYTES = 2 * 1024 * 1024  # Larger sources are nearly always generated
+SECRET_SCAN_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+# ripgrep, when installed, prefilters the secret scan in a single process
+RG = shutil.which("rg")
+
+# Info.plist usage description keys and how they are reported.
+IOS_PERMISSION_KEYS = {
+    "NSCameraUsageDescription": "Camera",
+    "NSPhotoLibraryUsageDescription": "Photo Library",
+    "NSLocationWhenInUseUsageDescription": "Location (When In Use)",
+    "NSLocationAlwaysAndWhenInUseUsageDescription": "Location (Always)",
+    "NSMicrophoneUsageDescription": "Microphone",
+    "NSContactsUsageDescription": "Contacts",
+    "NSCalendarsUsageDescription": "Calendars",
+    "NSBluetoothAlwaysUsageDescription": "Bluetooth",
+    "NSFaceIDUsageDescription": "Face ID",
+    "NSMotionUsageDescription": "Motion",
+    "NSLocalNetworkUsageDescription": "Local Network",
+    "NSSpeechRecognitionUsageDescription": "Speech Recognition",
+    "NSHealthShareUsageDescription": "Health (Read)",
+    "NSHealthUpdateUsageDescription": "Health (Write)",
+    "NSUserTrackingUsageDescription": "Tracking (ATT)",
+}
+IOS_LOCATION_PERMISSION_KEYS = frozenset({
+    "NSLocationWhenInUseUsageDescription",
+    "NSLocationAlwaysAndWhenInUseUsageDescription",
+})
+
+# Android permissions that require a runtime request and review justification.
+DANGEROUS_PERMS = frozenset({
+    "ACCESS_FINE_LOCATION", "ACCESS_COARSE_LOCATION", "ACCESS_BACKGROUND_LOCATION",
+    "CAMERA", "RECORD_AUDIO", "READ_CONTACTS", "WRITE_CONTACTS",
+    "READ_CALENDAR", "WRITE_CALENDAR", "READ_PHONE_STATE",
+    "CALL_PHONE", "READ_CALL_LOG", "WRITE_CALL_LOG",
+    "BODY_SENSORS", "SEND_SMS", "READ_SMS",
+    "READ_EXTERNAL_STORAGE", "WRITE_EXTERNAL_STORAGE",
+    "QUERY_ALL_PACKAGES",
+})
+
+# Top-level Info.plist keys check_ios reads besides the permission descriptions.
+INFO_PLIST_KEYS = (
+    "CFBundleIdentifier",
+    "CFBundleShortVersionString",
+    "CFBundleVersion",
+    "NSAppTransportSecurity",
+)
+
+RE_VERSION_NAME = re.compile(r'versionName\s+["\']([^"\']+)["\']')
+RE_VERSION_CODE = re.compile(r'versionCode\s+(\d+)')
+RE_MIN_SDK = re.compile(r'minSdk(?:Version)?\s+(\d+)')
+RE_TARGET_SDK = re.compile(r'targetSdk(?:Version)?\s+(\d+)')
+RE_COMPILE_SDK = re.compile(r'compileSdk(?:Version)?\s+(\d+)')
+RE_PUBSPEC_VERSION = re.compile(r'^version:\s*(.+)$', re.MULTILINE)
+
+ANDROID_NAME_ATTR = "{http://schemas.android.com/apk/res/android}name"
+
+# Text checks never need more than the head of a file.
+READ_HEAD_LIMIT = 256 * 1024
+
+# Dependency, build output and VCS directories; scan_repo never descends into them.
+PRUNE_DIRS = frozenset({
+    "Pods", "build", "DerivedData", "node_modules", ".git",
+    ".dart_tool", ".gradle", "Carthage", "vendor",
+})
+
+# Inventory buckets filled by scan_repo, keyed by what the checks look for.
+INVENTORY_FILE_NAMES = ("Info.plist", "PrivacyInfo.xcprivacy", "AndroidManifest.xml")
+INVENTORY_SUFFIXES = (".swift", ".kt", ".java", ".m", ".mm")
+INVENTORY_KEYS = (
+    *INVENTORY_FILE_NAMES,
+    *INVENTORY_SUFFIXES,
+    "AppIcon.appiconset",
+    "mipmap-*",
+    ".env*",
+)
+
+Inventory = dict[str, list[Path]]
+
+# One finding; converted to a dict only when the report is serialized.
+Issue = namedtuple("Issue", "platform category message severity")
 
 
 def normalize_text(value: str) -> str:
@@ -48,20 +158,164 @@ def get_vague_permission_phrase(value: str) -> str | None:
     return None
 
 
-def detect_subscription_signals(root: Path, swift_files: list[Path]) -> list[str]:
+@functools.lru_cache(maxsize=None)
+def _exists(path: Path) -> bool:
+    """Memoized os.path.exists; detection and the checks probe the same paths."""
+    return os.path.exists(path)
+
+
+def files_under(paths: list[Path], directory: Path) -> list[Path]:
+    """Keep the inventory paths that live inside directory."""
+    prefix = os.path.join(directory, "")
+    return [path for path in paths if str(path).startswith(prefix)]
+
+
+def rel_path(path: Path, root: Path) -> str:
+    """Format path relative to root by slicing off the root prefix."""
+    return str(path)[len(os.path.join(root, "")):]
+
+
+def read_head(path: Path, limit: int = READ_HEAD_LIMIT) -> str:
+    """Read at most ``limit`` bytes of a text file, ignoring decode errors."""
+    with open(path, "rb") as f:
+        return f.read(limit).decode("utf-8", "ignore")
+
+
+def scan_repo(root: Path) -> Inventory:
+    """Walk the project once and bucket every path the checks need.
+
+    Pruned directories are skipped before descending, and symlinked
+    directories are not followed. ``.env*`` only matches at the root, where
+    matching directories (usually virtualenvs) are recorded but not walked.
+    """
+    inventory = {key: [] for key in INVENTORY_KEYS}
+
+    def walk(directory: str, is_root: bool) -> None:
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if is_root and name.startswith(".env"):
+                        inventory[".env*"].append(Path(entry.path))
+                    elif entry.is_dir(follow_symlinks=False):
+                        if name in PRUNE_DIRS:
+                            continue
+                        if name == "AppIcon.appiconset":
+                            inventory["AppIcon.appiconset"].append(Path(entry.path))
+                        elif name.startswith("mipmap-"):
+                            inventory["mipmap-*"].append(Path(entry.path))
+                        subdirs.append(entry.path)
+                    elif name in INVENTORY_FILE_NAMES:
+                        inventory[name].append(Path(entry.path))
+                    else:
+                        suffix = os.path.splitext(name)[1]
+                        if suffix in INVENTORY_SUFFIXES:
+                            inventory[suffix].append(Path(entry.path))
+        except OSError:
+            return
+        # Files of a directory come before its subdirectories, matching glob order
+        for subdir in subdirs:
+            walk(subdir, False)
+
+    walk(str(root), True)
+    return inventory
+
+
+def _secret_resume_offset(head: bytes) -> int:
+    """Return where a match crossing the end of head could start at the earliest.
+
+    A secret match holds at most one '"' before its last byte (the generic
+    pattern's opening quote), so it must start after the second-to-last
+    quote in head.
+    """
+    last_quote = head.rfind(b'"')
+    return head.rfind(b'"', 0, max(last_quote, 0)) + 1
+
+
+def find_secret(path: Path) -> str | None:
+    """Return the description of a hardcoded secret in a source file, if any.
+
+    Searches the first chunk before reading the rest, and skips files over
+    SECRET_SCAN_MAX_BYTES entirely.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > SECRET_SCAN_MAX_BYTES:
+            return None
+        buf = f.read(SECRET_SCAN_CHUNK)
+        match = SECRET_RE.search(buf)
+        # Only a generic hit settles the label; otherwise read on
+        if (not match or match.lastgroup != "generic") and len(buf) == SECRET_SCAN_CHUNK:
+            rest = f.read()
+            if match:
+                # A higher-priority pattern may still appear later in the file
+                buf += rest
+            else:
+                # Nothing matched inside the head, so only rescan its tail
+                buf = buf[_secret_resume_offset(buf):] + rest
+                match = SECRET_RE.search(buf)
+    if not match:
+        return None
+    # Report by pattern priority rather than by leftmost match
+    for name, pattern in SECRET_PATTERNS.items():
+        if name == match.lastgroup or pattern.search(buf):
+            return SECRET_LABELS[name]
+
+
+def _scan_one(path: Path) -> str | None:
+    try:
+        return find_secret(path)
+    except OSError:
+        return None
+
+
+def _rg_matching_files(files: list[Path]) -> set[str] | None:
+    """Return the files ripgrep finds SECRET_RE in, or None if rg failed.
+
+    --no-unicode makes rg match bytes like the bytes SECRET_RE, so
+    non-UTF-8 sources and multibyte values are not dropped.
+    """
+    try:
+        proc = subprocess.run(
+            [
+                RG, "--no-config", "--files-with-matches", "--no-messages", "--multiline",
+                "--no-unicode", "-e", SECRET_RE.pattern.decode(), "--", *map(str, files),
+            ],
+            capture_output=True,
+        )
+    except OSError:
+        return None
+    # 0: matches, 1: no matches, 2: error (fall back to the Python scan)
+    if proc.returncode not in (0, 1):
+        return None
+    # Decode like os.fsencode'd argv so non-UTF-8 filenames round-trip
+    return {os.fsdecode(line) for line in proc.stdout.splitlines()}
+
+
+def scan_for_secrets(files: list[Path]) -> list[tuple[Path, str]]:
+    """Scan files for hardcoded secrets in parallel, keeping input order.
+
+    With ripgrep available only the files it flags are re-read in Python,
+    to find which pattern matched.
+    """
+    if RG and files:
+        matching = _rg_matching_files(files)
+        if matching is not None:
+            files = [path for path in files if str(path) in matching]
+    with ThreadPoolExecutor(max_workers=SECRET_SCAN_WORKERS) as executor:
+        return [(path, desc) for path, desc in zip(files, executor.map(_scan_one, files)) if desc]
+
+
+def detect_subscription_signals(root: Path, swift_files: list[Path], inventory: Inventory) -> list[str]:
     """Detect common iOS subscription/IAP integrations for review reminders."""
     candidate_files = []
     for path in (root / "pubspec.yaml", root / "package.json"):
-        if path.exists():
+        if _exists(path):
             candidate_files.append(path)
 
-    objective_c_files = list(root.glob("**/*.m")) + list(root.glob("**/*.mm"))
-    filtered_objective_c = [
-        path for path in objective_c_files
-        if not any(segment in str(path) for segment in SKIP_PATH_SEGMENTS)
-    ]
+    objective_c_files = inventory[".m"] + inventory[".mm"]
     candidate_files.extend(swift_files[:200])
-    candidate_files.extend(filtered_objective_c[:100])
+    candidate_files.extend(objective_c_files[:100])
 
     patterns = {
         "StoreKit": r"\bStoreKit\b|SKProduct|SubscriptionStoreView|Product\.SubscriptionInfo",
@@ -73,7 +327,7 @@ def detect_subscription_signals(root: Path, swift_files: list[Path]) -> list[str
     detected = set()
     for path in candidate_files:
         try:
-            content = path.read_text(errors="ignore")
+            content = read_head(path)
         except OSError:
             continue
 
@@ -91,26 +345,33 @@ def detect_project_type(root: Path) -> dict:
         "platforms": [],     # ["ios", "android"]
     }
 
+    # One directory read answers every top-level probe below
+    with os.scandir(root) as entries:
+        children = {entry.name: entry for entry in entries}
+
     # Flutter
-    if (root / "pubspec.yaml").exists() and (root / "lib").exists():
+    if "pubspec.yaml" in children and "lib" in children:
         result["framework"] = "flutter"
-        if (root / "ios").exists():
+        if "ios" in children:
             result["platforms"].append("ios")
-        if (root / "android").exists():
+        if "android" in children:
             result["platforms"].append("android")
         return result
 
     # React Native
     pkg_json = root / "package.json"
-    if pkg_json.exists():
+    if "package.json" in children:
         try:
-            pkg = json.loads(pkg_json.read_text())
+            pkg_bytes = pkg_json.read_bytes()
+            # Tooling-only package.json files (common in native repos) skip the parse
+            has_rn_key = b'"react-native"' in pkg_bytes or b'"expo"' in pkg_bytes
+            pkg = _loads(pkg_bytes) if has_rn_key else {}
             deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
             if "react-native" in deps or "expo" in deps:
                 result["framework"] = "react-native"
-                if (root / "ios").exists():
+                if "ios" in children:
                     result["platforms"].append("ios")
-                if (root / "android").exists():
+                if "android" in children:
                     result["platforms"].append("android")
                 return result
         except (json.JSONDecodeError, OSError):
@@ -118,18 +379,20 @@ def detect_project_type(root: Path) -> dict:
 
     # Native
     result["framework"] = "native"
-    xcodeproj = list(root.glob("*.xcodeproj")) + list(root.glob("*.xcworkspace"))
-    if xcodeproj or (root / "ios").exists():
+    xcodeproj = [name for name in children if name.endswith((".xcodeproj", ".xcworkspace"))]
+    if xcodeproj or "ios" in children:
         result["platforms"].append("ios")
-    if (root / "app" / "build.gradle").exists() or (root / "app" / "build.gradle.kts").exists():
+    if "app" in children and (_exists(root / "app" / "build.gradle") or _exists(root / "app" / "build.gradle.kts")):
         result["platforms"].append("android")
-    elif (root / "android" / "app" / "build.gradle").exists() or (root / "android" / "app" / "build.gradle.kts").exists():
+    elif "android" in children and (
+        _exists(root / "android" / "app" / "build.gradle") or _exists(root / "android" / "app" / "build.gradle.kts")
+    ):
         result["platforms"].append("android")
 
     return result
 
 
-def find_info_plist(root: Path) -> Path | None:
+def find_info_plist(root: Path, inventory: Inventory) -> Path | None:
     """Find the main Info.plist file."""
     candidates = [
         root / "ios" / "Runner" / "Info.plist",        # Flutter
@@ -137,32 +400,26 @@ def find_info_plist(root: Path) -> Path | None:
     ]
     # Search for Info.plist in common locations
     for p in candidates:
-        if p.exists():
-            return p
-    # Glob for it
-    plists = list(root.glob("**/Info.plist"))
-    # Prefer ones not in Pods or build directories
-    for p in plists:
-        parts = str(p)
-        if "Pods" not in parts and "build" not in parts and "DerivedData" not in parts:
+        if _exists(p):
             return p
+    # Fall back to the repo inventory (Pods and build directories are pruned)
+    plists = inventory["Info.plist"]
     return plists[0] if plists else None
 
 
-def find_android_manifest(root: Path) -> Path | None:
+def find_android_manifest(root: Path, inventory: Inventory) -> Path | None:
     """Find the main AndroidManifest.xml."""
     candidates = [
         root / "android" / "app" / "src" / "main" / "AndroidManifest.xml",
         root / "app" / "src" / "main" / "AndroidManifest.xml",
     ]
     for p in candidates:
-        if p.exists():
+        if _exists(p):
             return p
-    manifests = list(root.glob("**/src/main/AndroidManifest.xml"))
-    for m in manifests:
-        if "build" not in str(m):
+    for m in inventory["AndroidManifest.xml"]:
+        if m.parent.parts[-2:] == ("src", "main"):
             return m
-    return manifests[0] if manifests else None
+    return None
 
 
 def find_build_gradle(root: Path) -> Path | None:
@@ -174,34 +431,110 @@ def find_build_gradle(root: Path) -> Path | None:
         root / "app" / "build.gradle.kts",
     ]
     for p in candidates:
-        if p.exists():
+        if _exists(p):
             return p
     return None
 
 
-def check_ios(root: Path, framework: str) -> list[dict]:
+def _plist_value(elem: ET.Element):
+    """Convert an XML plist value element the way plistlib would."""
+    tag = elem.tag
+    if tag == "string":
+        return elem.text or ""
+    if tag == "integer":
+        return int(elem.text)
+    if tag == "real":
+        return float(elem.text)
+    if tag in ("true", "false"):
+        return tag == "true"
+    if tag == "dict":
+        children = list(elem)
+        return {k.text or "": _plist_value(v) for k, v in zip(children[::2], children[1::2])}
+    if tag == "array":
+        return [_plist_value(child) for child in elem]
+    # <date> and <data> are never consulted; keep the raw text
+    return elem.text
+
+
+def read_plist_keys(path: Path, keys: set[str]) -> dict:
+    """Read only the given top-level keys from a plist.
+
+    XML plists are streamed with iterparse and parsing stops once every key
+    is found. Binary plists go through plistlib.
+    """
+    with open(path, "rb") as f:
+        if f.read(8) == b"bplist00":
+            f.seek(0)
+            plist = plistlib.load(f)
+            return {key: plist[key] for key in keys if key in plist}
+        f.seek(0)
+
+        found = {}
+        key = None
+        depth = 0
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            # depth 2 after closing: a direct child of the top-level <dict>
+            if depth != 2:
+                continue
+            if elem.tag == "key":
+                key = elem.text
+            elif key is not None:
+                if key in keys:
+                    found[key] = _plist_value(elem)
+                    if len(found) == len(keys):
+                        break
+                key = None
+            elem.clear()
+    return found
+
+
+def read_android_manifest(path: Path) -> tuple[str | None, list[str]]:
+    """Return the manifest package and its top-level uses-permission names.
+
+    Streams the file with iterparse instead of building the whole tree.
+    """
+    package = None
+    permissions = []
+    depth = 0
+    with open(path, "rb") as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "end":
+                depth -= 1
+                elem.clear()
+                continue
+            depth += 1
+            if depth == 1:
+                package = elem.get("package")
+            elif depth == 2 and elem.tag == "uses-permission":
+                permissions.append(elem.get(ANDROID_NAME_ATTR, ""))
+    return package, permissions
+
+
+def check_ios(root: Path, framework: str, inventory: Inventory) -> list[Issue]:
     """Run iOS-specific checks."""
     issues = []
 
     def warn(category, message, severity="warning"):
-        issues.append({"platform": "ios", "category": category, "message": message, "severity": severity})
+        issues.append(Issue("ios", category, message, severity))
 
     def error(category, message):
         warn(category, message, "error")
 
     def ok(category, message):
-        issues.append({"platform": "ios", "category": category, "message": message, "severity": "pass"})
+        issues.append(Issue("ios", category, message, "pass"))
 
-    swift_files = list(root.glob("**/*.swift"))
-    swift_files = [f for f in swift_files if not any(segment in str(f) for segment in SKIP_PATH_SEGMENTS)]
+    swift_files = inventory[".swift"]
 
     # Info.plist
-    plist_path = find_info_plist(root)
+    plist_path = find_info_plist(root, inventory)
     if plist_path:
-        ok("config", f"Info.plist found at {plist_path.relative_to(root)}")
+        ok("config", f"Info.plist found at {rel_path(plist_path, root)}")
         try:
-            with open(plist_path, "rb") as f:
-                plist = plistlib.load(f)
+            plist = read_plist_keys(plist_path, {*INFO_PLIST_KEYS, *IOS_PERMISSION_KEYS})
 
             # Check bundle identifier
             bundle_id = plist.get("CFBundleIdentifier")
@@ -224,35 +557,14 @@ def check_ios(root: Path, framework: str) -> list[dict]:
                 error("version", "CFBundleVersion (build number) missing")
 
             # Check permission usage descriptions
-            permission_keys = {
-                "NSCameraUsageDescription": "Camera",
-                "NSPhotoLibraryUsageDescription": "Photo Library",
-                "NSLocationWhenInUseUsageDescription": "Location (When In Use)",
-                "NSLocationAlwaysAndWhenInUseUsageDescription": "Location (Always)",
-                "NSMicrophoneUsageDescription": "Microphone",
-                "NSContactsUsageDescription": "Contacts",
-                "NSCalendarsUsageDescription": "Calendars",
-                "NSBluetoothAlwaysUsageDescription": "Bluetooth",
-                "NSFaceIDUsageDescription": "Face ID",
-                "NSMotionUsageDescription": "Motion",
-                "NSLocalNetworkUsageDescription": "Local Network",
-                "NSSpeechRecognitionUsageDescription": "Speech Recognition",
-                "NSHealthShareUsageDescription": "Health (Read)",
-                "NSHealthUpdateUsageDescription": "Health (Write)",
-                "NSUserTrackingUsageDescription": "Tracking (ATT)",
-            }
             found_permissions = []
-            location_permission_keys = {
-                "NSLocationWhenInUseUsageDescription",
-                "NSLocationAlwaysAndWhenInUseUsageDescription",
-            }
             location_permission_detected = False
-            for key, name in permission_keys.items():
+            for key, name in IOS_PERMISSION_KEYS.items():
                 val = plist.get(key)
                 if val:
                     found_permissions.append(name)
                     normalized_val = normalize_text(str(val))
-                    if key in location_permission_keys:
+                    if key in IOS_LOCATION_PERMISSION_KEYS:
                         location_permission_detected = True
 
                     if len(normalized_val) < 10:
@@ -284,21 +596,19 @@ def check_ios(root: Path, framework: str) -> list[dict]:
         error("config", "Info.plist not found")
 
     # Privacy manifest
-    privacy_manifests = list(root.glob("**/PrivacyInfo.xcprivacy"))
-    privacy_manifests = [p for p in privacy_manifests if "Pods" not in str(p) and "build" not in str(p)]
+    privacy_manifests = inventory["PrivacyInfo.xcprivacy"]
     if privacy_manifests:
-        ok("privacy", f"Privacy manifest found: {privacy_manifests[0].relative_to(root)}")
+        ok("privacy", f"Privacy manifest found: {rel_path(privacy_manifests[0], root)}")
     else:
         error("privacy", "PrivacyInfo.xcprivacy not found. Required since iOS 17.")
 
     # App icon
-    icon_sets = list(root.glob("**/AppIcon.appiconset"))
-    icon_sets = [p for p in icon_sets if "Pods" not in str(p) and "build" not in str(p)]
+    icon_sets = inventory["AppIcon.appiconset"]
     if icon_sets:
         contents_json = icon_sets[0] / "Contents.json"
-        if contents_json.exists():
+        if _exists(contents_json):
             try:
-                contents = json.loads(contents_json.read_text())
+                contents = _loads(contents_json.read_bytes())
                 images = contents.get("images", [])
                 has_1024 = any(
                     img.get("size") == "1024x1024" and img.get("filename")
@@ -315,7 +625,7 @@ def check_ios(root: Path, framework: str) -> list[dict]:
     else:
         error("assets", "AppIcon.appiconset not found")
 
-    subscription_signals = detect_subscription_signals(root, swift_files)
+    subscription_signals = detect_subscription_signals(root, swift_files, inventory)
     if subscription_signals:
         warn(
             "metadata",
@@ -324,48 +634,37 @@ def check_ios(root: Path, framework: str) -> list[dict]:
         )
 
     # Hardcoded secrets check (basic)
-    secret_patterns = [
-        (r'(?i)(api[_-]?key|secret[_-]?key|password)\s*[:=]\s*"[^"]{8,}"', "Possible hardcoded API key/secret"),
-        (r'sk[-_](?:live|test)_[a-zA-Z0-9]{20,}', "Possible Stripe secret key"),
-        (r'AIza[0-9A-Za-z\-_]{35}', "Possible Google API key"),
-    ]
-    for sf in swift_files[:200]:  # Limit scan scope
-        try:
-            content = sf.read_text(errors="ignore")
-            for pattern, desc in secret_patterns:
-                if re.search(pattern, content):
-                    warn("security", f"{desc} found in {sf.relative_to(root)}")
-                    break
-        except OSError:
-            pass
+    secret_scan_files = swift_files
+    if framework in ("flutter", "react-native"):
+        # Native iOS sources of cross-platform projects live under ios/
+        secret_scan_files = files_under(swift_files, root / "ios")
+    for sf, desc in scan_for_secrets(secret_scan_files[:200]):  # Limit scan scope
+        warn("security", f"{desc} found in {rel_path(sf, root)}")
 
     return issues
 
 
-def check_android(root: Path, framework: str) -> list[dict]:
+def check_android(root: Path, framework: str, inventory: Inventory) -> list[Issue]:
     """Run Android-specific checks."""
     issues = []
 
     def warn(category, message, severity="warning"):
-        issues.append({"platform": "android", "category": category, "message": message, "severity": severity})
+        issues.append(Issue("android", category, message, severity))
 
     def error(category, message):
         warn(category, message, "error")
 
     def ok(category, message):
-        issues.append({"platform": "android", "category": category, "message": message, "severity": "pass"})
+        issues.append(Issue("android", category, message, "pass"))
 
     # AndroidManifest.xml
-    manifest_path = find_android_manifest(root)
+    manifest_path = find_android_manifest(root, inventory)
     if manifest_path:
-        ok("config", f"AndroidManifest.xml found at {manifest_path.relative_to(root)}")
+        ok("config", f"AndroidManifest.xml found at {rel_path(manifest_path, root)}")
         try:
-            tree = ET.parse(manifest_path)
-            manifest_root = tree.getroot()
-            ns = {"android": "http://schemas.android.com/apk/res/android"}
+            package, declared_permissions = read_android_manifest(manifest_path)
 
             # Package name
-            package = manifest_root.get("package")
             if package:
                 ok("config", f"Package name: {package}")
             else:
@@ -373,23 +672,11 @@ def check_android(root: Path, framework: str) -> list[dict]:
                 warn("config", "Package name not in manifest (may be set in build.gradle)")
 
             # Permissions
-            permissions = []
-            for perm in manifest_root.findall("uses-permission"):
-                perm_name = perm.get(f"{{{ns['android']}}}name", "")
-                permissions.append(perm_name.split(".")[-1])
+            permissions = [perm_name.split(".")[-1] for perm_name in declared_permissions]
             if permissions:
                 ok("privacy", f"Declared permissions: {', '.join(permissions)}")
 
-            dangerous_perms = [
-                "ACCESS_FINE_LOCATION", "ACCESS_COARSE_LOCATION", "ACCESS_BACKGROUND_LOCATION",
-                "CAMERA", "RECORD_AUDIO", "READ_CONTACTS", "WRITE_CONTACTS",
-                "READ_CALENDAR", "WRITE_CALENDAR", "READ_PHONE_STATE",
-                "CALL_PHONE", "READ_CALL_LOG", "WRITE_CALL_LOG",
-                "BODY_SENSORS", "SEND_SMS", "READ_SMS",
-                "READ_EXTERNAL_STORAGE", "WRITE_EXTERNAL_STORAGE",
-                "QUERY_ALL_PACKAGES",
-            ]
-            used_dangerous = [p for p in permissions if p in dangerous_perms]
+            used_dangerous = [p for p in permissions if p in DANGEROUS_PERMS]
             if used_dangerous:
                 warn("privacy", f"Dangerous permissions detected: {', '.join(used_dangerous)}. Ensure runtime permission requests and justification.")
 
@@ -405,22 +692,22 @@ def check_android(root: Path, framework: str) -> list[dict]:
     # build.gradle
     gradle_path = find_build_gradle(root)
     if gradle_path:
-        ok("config", f"build.gradle found at {gradle_path.relative_to(root)}")
+        ok("config", f"build.gradle found at {rel_path(gradle_path, root)}")
         try:
-            gradle_content = gradle_path.read_text()
+            gradle_content = read_head(gradle_path)
 
             # Version info
-            version_match = re.search(r'versionName\s+["\']([^"\']+)["\']', gradle_content)
-            version_code_match = re.search(r'versionCode\s+(\d+)', gradle_content)
+            version_match = RE_VERSION_NAME.search(gradle_content)
+            version_code_match = RE_VERSION_CODE.search(gradle_content)
             if version_match:
                 ok("version", f"versionName: {version_match.group(1)}")
             if version_code_match:
                 ok("version", f"versionCode: {version_code_match.group(1)}")
 
             # SDK versions
-            min_sdk = re.search(r'minSdk(?:Version)?\s+(\d+)', gradle_content)
-            target_sdk = re.search(r'targetSdk(?:Version)?\s+(\d+)', gradle_content)
-            compile_sdk = re.search(r'compileSdk(?:Version)?\s+(\d+)', gradle_content)
+            min_sdk = RE_MIN_SDK.search(gradle_content)
+            target_sdk = RE_TARGET_SDK.search(gradle_content)
+            compile_sdk = RE_COMPILE_SDK.search(gradle_content)
 
             if target_sdk:
                 sdk_val = int(target_sdk.group(1))
@@ -447,10 +734,10 @@ def check_android(root: Path, framework: str) -> list[dict]:
         error("config", "App-level build.gradle not found")
 
     # App icons
-    android_base = root / "android" if (root / "android").exists() else root
+    android_base = root / "android" if _exists(root / "android") else root
     res_dir = android_base / "app" / "src" / "main" / "res"
-    if res_dir.exists():
-        mipmap_dirs = list(res_dir.glob("mipmap-*"))
+    if _exists(res_dir):
+        mipmap_dirs = [d for d in inventory["mipmap-*"] if d.parent == res_dir]
         if mipmap_dirs:
             ok("assets", f"Mipmap directories found: {len(mipmap_dirs)} densities")
         else:
@@ -466,45 +753,35 @@ def check_android(root: Path, framework: str) -> list[dict]:
         warn("assets", f"Resource directory not found at expected path")
 
     # Hardcoded secrets
-    java_kotlin_files = list(root.glob("**/*.kt")) + list(root.glob("**/*.java"))
-    java_kotlin_files = [f for f in java_kotlin_files if "build" not in str(f) and ".gradle" not in str(f)]
-    secret_patterns = [
-        (r'(?i)(api[_-]?key|secret[_-]?key|password)\s*=\s*"[^"]{8,}"', "Possible hardcoded API key/secret"),
-        (r'sk[-_](?:live|test)_[a-zA-Z0-9]{20,}', "Possible Stripe secret key"),
-        (r'AIza[0-9A-Za-z\-_]{35}', "Possible Google API key"),
-    ]
-    for jf in java_kotlin_files[:200]:
-        try:
-            content = jf.read_text(errors="ignore")
-            for pattern, desc in secret_patterns:
-                if re.search(pattern, content):
-                    warn("security", f"{desc} found in {jf.relative_to(root)}")
-                    break
-        except OSError:
-            pass
+    java_kotlin_files = inventory[".kt"] + inventory[".java"]
+    if framework in ("flutter", "react-native"):
+        # Native Android sources of cross-platform projects live under android/
+        java_kotlin_files = files_under(java_kotlin_files, root / "android")
+    for jf, desc in scan_for_secrets(java_kotlin_files[:200]):
+        warn("security", f"{desc} found in {rel_path(jf, root)}")
 
     return issues
 
 
-def check_flutter(root: Path) -> list[dict]:
+def check_flutter(root: Path) -> list[Issue]:
     """Run Flutter-specific checks."""
     issues = []
 
     def warn(category, message, severity="warning"):
-        issues.append({"platform": "flutter", "category": category, "message": message, "severity": severity})
+        issues.append(Issue("flutter", category, message, severity))
 
     def error(category, message):
         warn(category, message, "error")
 
     def ok(category, message):
-        issues.append({"platform": "flutter", "category": category, "message": message, "severity": "pass"})
+        issues.append(Issue("flutter", category, message, "pass"))
 
     pubspec = root / "pubspec.yaml"
-    if pubspec.exists():
-        content = pubspec.read_text()
+    if _exists(pubspec):
+        content = read_head(pubspec)
 
         # Version
-        version_match = re.search(r'^version:\s*(.+)$', content, re.MULTILINE)
+        version_match = RE_PUBSPEC_VERSION.search(content)
         if version_match:
             ok("version", f"Version in pubspec.yaml: {version_match.group(1).strip()}")
         else:
@@ -517,31 +794,31 @@ def check_flutter(root: Path) -> list[dict]:
             warn("config", "No Dart SDK constraint in pubspec.yaml")
 
     # Podfile.lock
-    if (root / "ios" / "Podfile.lock").exists():
+    if _exists(root / "ios" / "Podfile.lock"):
         ok("config", "ios/Podfile.lock committed")
-    elif (root / "ios").exists():
+    elif _exists(root / "ios"):
         warn("config", "ios/Podfile.lock not found. Should be committed to version control.")
 
     return issues
 
 
-def check_react_native(root: Path) -> list[dict]:
+def check_react_native(root: Path) -> list[Issue]:
     """Run React Native-specific checks."""
     issues = []
 
     def warn(category, message, severity="warning"):
-        issues.append({"platform": "react-native", "category": category, "message": message, "severity": severity})
+        issues.append(Issue("react-native", category, message, severity))
 
     def error(category, message):
         warn(category, message, "error")
 
     def ok(category, message):
-        issues.append({"platform": "react-native", "category": category, "message": message, "severity": "pass"})
+        issues.append(Issue("react-native", category, message, "pass"))
 
     pkg_json = root / "package.json"
-    if pkg_json.exists():
+    if _exists(pkg_json):
         try:
-            pkg = json.loads(pkg_json.read_text())
+            pkg = _loads(pkg_json.read_bytes())
             deps = pkg.get("dependencies", {})
             dev_deps = pkg.get("devDependencies", {})
 
@@ -558,7 +835,7 @@ def check_react_native(root: Path) -> list[dict]:
                 app_json = root / "app.json"
                 app_config = root / "app.config.js"
                 app_config_ts = root / "app.config.ts"
-                if app_json.exists() or app_config.exists() or app_config_ts.exists():
+                if _exists(app_json) or _exists(app_config) or _exists(app_config_ts):
                     ok("config", "App config file found")
                 else:
                     error("config", "No app.json or app.config.js found for Expo project")
@@ -578,34 +855,34 @@ def check_react_native(root: Path) -> list[dict]:
             warn("config", "Could not parse package.json")
 
     # Podfile.lock
-    if (root / "ios" / "Podfile.lock").exists():
+    if _exists(root / "ios" / "Podfile.lock"):
         ok("config", "ios/Podfile.lock committed")
-    elif (root / "ios").exists():
+    elif _exists(root / "ios"):
         warn("config", "ios/Podfile.lock not found. Should be committed to version control.")
 
     return issues
 
 
-def check_common(root: Path) -> list[dict]:
+def check_common(root: Path, inventory: Inventory) -> list[Issue]:
     """Checks applicable to all project types."""
     issues = []
 
     def warn(category, message, severity="warning"):
-        issues.append({"platform": "common", "category": category, "message": message, "severity": severity})
+        issues.append(Issue("common", category, message, severity))
 
     def ok(category, message):
-        issues.append({"platform": "common", "category": category, "message": message, "severity": "pass"})
+        issues.append(Issue("common", category, message, "pass"))
 
     # .env files
-    env_files = list(root.glob(".env*"))
+    env_files = inventory[".env*"]
     env_files = [f for f in env_files if f.name != ".env.example" and f.name != ".env.template"]
     if env_files:
         warn("security", f"Environment files found: {', '.join(f.name for f in env_files)}. Ensure these are in .gitignore and not bundled in release builds.")
 
     # .gitignore check for secrets
     gitignore = root / ".gitignore"
-    if gitignore.exists():
-        gi_content = gitignore.read_text()
+    if _exists(gitignore):
+        gi_content = read_head(gitignore)
         if ".env" in gi_content:
             ok("security", ".env is in .gitignore")
         else:
@@ -616,14 +893,32 @@ def check_common(root: Path) -> list[dict]:
     # Privacy policy
     # Can't check URL validity without network, but check if referenced
     readme = root / "README.md"
-    if readme.exists():
-        readme_content = readme.read_text(errors="ignore")
+    if _exists(readme):
+        readme_content = read_head(readme)
         if "privacy" in readme_content.lower():
             ok("legal", "Privacy policy referenced in README")
 
     return issues
 
 
+def write_report(report: dict) -> None:
+    """Serialize the report straight to stdout without an intermediate str."""
+    if orjson:
+        try:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # Paths from non-UTF-8 filenames carry surrogate escapes, which
+            # orjson rejects; the stdlib writer escapes them instead
+            pass
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data + b"\n")
+            sys.stdout.buffer.flush()
+            return
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: check_project.py <project-root>", file=sys.stderr)
@@ -640,27 +935,33 @@ def main():
     project = detect_project_type(root)
     print(f"Detected: framework={project['framework']}, platforms={project['platforms']}", file=sys.stderr)
 
-    all_issues = []
+    # Walk the project once; every check reads from this inventory
+    inventory = scan_repo(root)
+
+    # The checks are independent and only read the shared inventory, so run
+    # them concurrently; futures are collected in submission order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Common checks
+        futures = [executor.submit(check_common, root, inventory)]
 
-    # Common checks
-    all_issues.extend(check_common(root))
+        # Framework-specific
+        if project["framework"] == "flutter":
+            futures.append(executor.submit(check_flutter, root))
+        elif project["framework"] == "react-native":
+            futures.append(executor.submit(check_react_native, root))
 
-    # Framework-specific
-    if project["framework"] == "flutter":
-        all_issues.extend(check_flutter(root))
-    elif project["framework"] == "react-native":
-        all_issues.extend(check_react_native(root))
+        # Platform-specific
+        if "ios" in project["platforms"]:
+            futures.append(executor.submit(check_ios, root, project["framework"], inventory))
+        if "android" in project["platforms"]:
+            futures.append(executor.submit(check_android, root, project["framework"], inventory))
 
-    # Platform-specific
-    if "ios" in project["platforms"]:
-        all_issues.extend(check_ios(root, project["framework"]))
-    if "android" in project["platforms"]:
-        all_issues.extend(check_android(root, project["framework"]))
+        all_issues = [issue for future in futures for issue in future.result()]
 
     # Summary
-    errors = [i for i in all_issues if i["severity"] == "error"]
-    warnings = [i for i in all_issues if i["severity"] == "warning"]
-    passes = [i for i in all_issues if i["severity"] == "pass"]
+    errors = [i for i in all_issues if i.severity == "error"]
+    warnings = [i for i in all_issues if i.severity == "warning"]
+    passes = [i for i in all_issues if i.severity == "pass"]
 
     report = {
         "project_root": str(root),
@@ -670,10 +971,10 @@ def main():
             "warnings": len(warnings),
             "passes": len(passes),
         },
-        "issues": all_issues,
+        "issues": [issue._asdict() for issue in all_issues],
     }
 
-    print(json.dumps(report, indent=2))
+    write_report(report)
 
     print(f"\nResults: {len(errors)} errors, {len(warnings)} warnings, {len(passes)} passed", file=sys.stderr)
 